@@ -13,7 +13,7 @@ echo "Performance tuning (set env vars to customize):"
 echo "  WHISPER_MODEL=small.en      # tiny.en|base.en|small.en|medium.en|large-v3"
 echo "  WHISPER_COMPUTE_TYPE=int8   # int8 (fast) or float32 (accurate)"
 echo "  WHISPER_BEAM_SIZE=1         # 1=fastest, 5=most accurate"
-echo "  WHISPER_VAD_FILTER=true     # Skip silence for faster processing"
+echo "  WHISPER_CPU_THREADS=0       # 0=auto (performance cores)"
 echo ""
 echo "Press Ctrl+C to quit the app."
 
@@ -8,6 +8,7 @@ For development/testing (creates alias mode app):
     python setup.py py2app -A
 """
 
+import glob
 import os
 import subprocess
 from setuptools import setup
@@ -23,45 +24,77 @@ DATA_FILES = []
 
 def find_portaudio():
     """Find the PortAudio dynamic library on the system."""
-    # Common locations for PortAudio on macOS
-    possible_paths = [
-        '/opt/homebrew/lib/libportaudio.dylib',      # Apple Silicon Homebrew
-        '/opt/homebrew/lib/libportaudio.2.dylib',    # Apple Silicon Homebrew (versioned)
-        '/usr/local/lib/libportaudio.dylib',          # Intel Homebrew
-        '/usr/local/lib/libportaudio.2.dylib',        # Intel Homebrew (versioned)
-    ]
+    # Manual override (e.g. on CI) skips discovery entirely
+    override = os.environ.get('PORTAUDIO_DYLIB')
+    if override:
+        print(f"Using PortAudio from PORTAUDIO_DYLIB: {override}")
+        return override
     
-    for path in possible_paths:
-        if os.path.exists(path):
-            print(f"Found PortAudio at: {path}")
-            return path
+    # Common locations for PortAudio on macOS (versioned name sorts first)
+    for lib_dir in (
+        '/opt/homebrew/lib',    # Apple Silicon Homebrew
+        '/usr/local/lib',       # Intel Homebrew
+    ):
+        matches = sorted(glob.glob(os.path.join(lib_dir, 'libportaudio*.dylib')))
+        if matches:
+            print(f"Found PortAudio at: {matches[0]}")
+            return matches[0]
     
-    # Try using brew to find it
+    # Fall back to asking brew (slow: spawns a subprocess)
     try:
         result = subprocess.run(
             ['brew', '--prefix', 'portaudio'],
             capture_output=True, text=True, check=True
         )
         brew_prefix = result.stdout.strip()
-        dylib_path = os.path.join(brew_prefix, 'lib', 'libportaudio.dylib')
-        if os.path.exists(dylib_path):
-            print(f"Found PortAudio via Homebrew at: {dylib_path}")
-            return dylib_path
-        # Try versioned name
-        dylib_path = os.path.join(brew_prefix, 'lib', 'libportaudio.2.dylib')
-        if os.path.exists(dylib_path):
-            print(f"Found PortAudio via Homebrew at: {dylib_path}")
-            return dylib_path
+        matches = sorted(glob.glob(os.path.join(brew_prefix, 'lib', 'libportaudio*.dylib')))
+        if matches:
+            print(f"Found PortAudio via Homebrew at: {matches[0]}")
+            return matches[0]
     except (subprocess.CalledProcessError, FileNotFoundError):
         pass
     
     print("WARNING: PortAudio not found. The app may not work on other machines.")
     print("Install it with: brew install portaudio")
+    print("Or point PORTAUDIO_DYLIB at libportaudio.dylib")
     return None
 
 PORTAUDIO_PATH = find_portaudio()
 FRAMEWORKS = [PORTAUDIO_PATH] if PORTAUDIO_PATH else []
 
+# ============================================================================
+# BUNDLED MODEL
+# ============================================================================
+# A Whisper model pre-converted to int8 can ship inside the app, so first
+# launch needs no download or conversion. Set BUNDLE_MODEL to a model name
+# (e.g. small.en) to convert it into models/<name>-int8 if it's not there yet;
+# anything already in models/ is bundled either way.
+MODELS_DIR = 'models'
+
+def convert_model(model_name):
+    """Convert an OpenAI Whisper model to int8 CTranslate2 format in MODELS_DIR.
+    
+    Requires ct2-transformers-converter (pip install ctranslate2 transformers torch)
+    at build time only.
+    """
+    output_dir = os.path.join(MODELS_DIR, f"{model_name}-int8")
+    if os.path.isfile(os.path.join(output_dir, 'model.bin')):
+        print(f"Using converted model at: {output_dir}")
+        return
+    print(f"Converting openai/whisper-{model_name} to int8 at: {output_dir}")
+    subprocess.run([
+        'ct2-transformers-converter',
+        '--model', f'openai/whisper-{model_name}',
+        '--quantization', 'int8',
+        '--copy_files', 'tokenizer.json', 'preprocessor_config.json',
+        '--output_dir', output_dir,
+    ], check=True)
+
+if os.environ.get('BUNDLE_MODEL'):
+    convert_model(os.environ['BUNDLE_MODEL'])
+
+RESOURCES = [MODELS_DIR] if os.path.isdir(MODELS_DIR) else []
+
 # Application metadata
 APP_NAME = 'Whisper Dictation'
 APP_VERSION = '1.0.0'
@@ -92,23 +125,31 @@ OPTIONS = {
     'plist': PLIST,
     'iconfile': None,  # Add path to .icns file if you have one: 'icon.icns'
     
-    # Packages that need to be included
+    # Packages copied whole. Keep this list short: everything here is copied
+    # file by file (tests, docs and all), which bloats the bundle and slows
+    # Gatekeeper's first-launch validation. Only list packages that modulegraph
+    # can't follow on its own:
+    #   - faster_whisper: ships the Silero VAD model as package data (assets/)
+    #   - ctranslate2: ships its native .dylibs inside the package
+    #   - huggingface_hub: resolves its submodules lazily via __getattr__
     'packages': [
         'rumps',
+        'pyaudio',
         'faster_whisper',
         'ctranslate2',
         'huggingface_hub',
-        'tokenizers',
-        'numpy',
-        'pyaudio',
-        'pynput',
-        'wave',
     ],
     
-    # Modules to include
+    # Modules to include (modulegraph follows only what these actually import)
     'includes': [
         'recording_indicator',
         'logger_config',
+        'tokenizers',
+        'numpy',
+        'pynput',
+        # pynput picks its platform backend at runtime
+        'pynput.keyboard._darwin',
+        'pynput.mouse._darwin',
     ],
     
     # Frameworks to include (for native dependencies)
@@ -116,7 +157,7 @@ OPTIONS = {
     'frameworks': FRAMEWORKS,
     
     # Resources to include
-    'resources': [],
+    'resources': RESOURCES,
     
     # Exclude unnecessary modules to reduce app size
     'excludes': [
@@ -129,8 +170,24 @@ OPTIONS = {
         'torch',  # faster-whisper uses ctranslate2, not torch
         'tensorflow',
         'keras',
+        # Unused subtrees of included packages
+        'numpy.tests',
+        'numpy.f2py',
+        'tokenizers.testing',
+        # Standard library parts the app never uses
+        'idlelib',
+        'turtledemo',
+        'test',
+        'unittest.test',
+        'lib2to3',
+        'ensurepip',
+        'pydoc_data',
     ],
     
+    # Byte-compile with -O (strips asserts). Not -OO: stripping docstrings
+    # breaks dependencies that build or patch __doc__ at import time.
+    'optimize': 1,
+    
     # Semi-standalone mode - still requires Python framework
     # Set to True for fully standalone (larger app)
     'semi_standalone': False,
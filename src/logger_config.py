@@ -1,94 +1,198 @@
+import atexit
 import logging
 import os
+import queue
 import sys
-from dotenv import load_dotenv
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 
 # Log file location
 LOG_DIR = os.path.expanduser("~/Library/Logs/WhisperDictation")
 LOG_FILE = os.path.join(LOG_DIR, "whisper-dictation.log")
 
+# .env locations checked when running from source: the working directory,
+# then the project root (one level above src/)
+DOTENV_PATHS = (
+    '.env',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env'),
+)
+
+# Background thread that writes queued records to the log file
+_queue_listener = None
+
 def get_log_file_path():
     """Return the path to the log file."""
     return LOG_FILE
 
+def shutdown_logging():
+    """Drain queued log records to disk and stop the file logging thread.
+
+    Safe to call more than once. Registered with atexit, but the app also calls
+    it explicitly since quitting via os._exit() or NSApp skips atexit.
+    """
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    listener, _queue_listener = _queue_listener, None
+    listener.stop()
+    for memory_handler in listener.handlers:
+        file_handler = memory_handler.target
+        memory_handler.close()  # flushes buffered records to the file
+        file_handler.close()
+
+atexit.register(shutdown_logging)
+
+def flush_logs():
+    """Write buffered log records to the log file now (e.g. before viewing it)."""
+    if _queue_listener is not None:
+        for handler in _queue_listener.handlers:
+            handler.flush()
+
+# ANSI color per log level
+_LEVEL_COLORS = {
+    'DEBUG': '\033[36m',    # Cyan
+    'INFO': '\033[32m',     # Green
+    'WARNING': '\033[33m',  # Yellow
+    'ERROR': '\033[31m',    # Red
+    'CRITICAL': '\033[1;31m' # Bold Red
+}
+
+class BatchedMemoryHandler(MemoryHandler):
+    """MemoryHandler that writes each batch to its FileHandler in one go.
+    
+    The stock MemoryHandler replays buffered records through the target one at
+    a time, and FileHandler flushes after every record. Here the whole batch
+    is formatted up front and written with a single write() + flush().
+    """
+    
+    def flush(self):
+        self.acquire()
+        try:
+            target = self.target
+            if target is None or not self.buffer:
+                return
+            chunk = ''.join(
+                target.format(record) + target.terminator
+                for record in self.buffer
+                if record.levelno >= target.level
+            )
+            target.acquire()
+            try:
+                if target.stream is None:
+                    target.stream = target._open()
+                target.stream.write(chunk)
+                target.flush()
+            except Exception:
+                target.handleError(self.buffer[-1])
+            finally:
+                target.release()
+            self.buffer.clear()
+        finally:
+            self.release()
+
 class ColoredFormatter(logging.Formatter):
     """Custom logging formatter with color support."""
     
-    COLORS = {
-        'DEBUG': '\033[36m',    # Cyan
-        'INFO': '\033[32m',     # Green
-        'WARNING': '\033[33m',  # Yellow
-        'ERROR': '\033[31m',    # Red
-        'CRITICAL': '\033[1;31m' # Bold Red
-    }
+    COLORS = _LEVEL_COLORS
     RESET = '\033[0m'
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.use_colors = os.getenv('NO_COLOR', 'false').lower() != 'true'
+        # Colors only make sense on an interactive terminal; when stderr is a
+        # pipe (bundled app, launchd) skip the color path entirely.
+        self.use_colors = (
+            os.getenv('NO_COLOR', 'false').lower() != 'true'
+            and sys.stderr is not None and sys.stderr.isatty()
+        )
+        if not self.use_colors:
+            self.format = super().format
+            return
+        
+        # Bake the color codes into one format string per level up front, so
+        # format() is a single dict lookup and never rewrites the record (which
+        # would leak ANSI codes into the log file handler).
+        self._level_formatters = {
+            level: logging.Formatter(
+                self._fmt.replace('%(levelname)s', f"{color}%(levelname)s{self.RESET}")
+                         .replace('%(message)s', f"{color}%(message)s{self.RESET}"),
+                datefmt=self.datefmt,
+            )
+            for level, color in self.COLORS.items()
+        }
     
     def format(self, record):
-        if self.use_colors:
-            level_color = self.COLORS.get(record.levelname, '')
-            record.levelname = f"{level_color}{record.levelname}{self.RESET}"
-            
-            log_message = super().format(record)
-            
-            if level_color:
-                parts = log_message.split(' - ', 2)
-                if len(parts) >= 3:
-                    timestamp, level, message = parts[0], parts[1], ' - '.join(parts[2:])
-                    return f"{timestamp} - {level} - {level_color}{message}{self.RESET}"
-            
-            return log_message
-        else:
-            return super().format(record)
+        formatter = self._level_formatters.get(record.levelname)
+        if formatter is not None:
+            return formatter.format(record)
+        return super().format(record)
 
-def setup_logging():
-    """Setup logging configuration with color support and file output."""
-    load_dotenv()
+def setup_logging(is_bundled=None):
+    """Setup logging configuration with color support and file output.
     
-    # Use DEBUG level for bundled app to capture more info
-    is_bundled = getattr(sys, 'frozen', False)
-    default_level = 'DEBUG' if is_bundled else 'INFO'
-    log_level = os.getenv('LOG_LEVEL', default_level).upper()
+    Args:
+        is_bundled: Whether we're running as a bundled .app. Detected from
+            sys.frozen when not given.
+    """
+    global _queue_listener
+    if is_bundled is None:
+        is_bundled = getattr(sys, 'frozen', False)
     
-    for handler in logging.root.handlers[:]:
-        logging.root.removeHandler(handler)
+    # The bundled app never ships a .env, so only import python-dotenv when
+    # running from source and a .env file actually exists
+    if not is_bundled:
+        dotenv_path = next((path for path in DOTENV_PATHS if os.path.isfile(path)), None)
+        if dotenv_path:
+            from dotenv import load_dotenv
+            load_dotenv(dotenv_path)
     
-    logging.basicConfig(
-        level=getattr(logging, log_level, logging.INFO),
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S',
-        handlers=[]
-    )
+    # INFO by default: DEBUG traces every key event and NSEvent, which is
+    # only worth paying for when chasing a problem (set LOG_LEVEL=DEBUG)
+    log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+    
+    level = getattr(logging, log_level, logging.INFO)
     
     logger = logging.getLogger()
-    logger.handlers = []
-    logger.setLevel(getattr(logging, log_level, logging.INFO))
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    logger.setLevel(level)
     
     # Console handler with colors
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(ColoredFormatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S'))
     logger.addHandler(console_handler)
     
-    # File handler (always write to file for debugging)
+    # Replace the file logging thread from any previous setup_logging() call
+    shutdown_logging()
+    
+    # File handler (always write to file for debugging). Records are handed to
+    # a queue and written by a background thread, so callers (audio and
+    # keyboard callbacks) never block on disk I/O.
     try:
-        os.makedirs(LOG_DIR, exist_ok=True)
-        file_handler = logging.FileHandler(LOG_FILE, mode='a', encoding='utf-8')
+        if not os.path.isdir(LOG_DIR):
+            os.makedirs(LOG_DIR, exist_ok=True)
+        # delay=True: don't open the file until the first batch is written
+        file_handler = logging.FileHandler(LOG_FILE, mode='a', encoding='utf-8', delay=True)
         file_handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         ))
-        file_handler.setLevel(logging.DEBUG)  # Always capture debug in file
-        logger.addHandler(file_handler)
+        file_handler.setLevel(logging.DEBUG)  # Write whatever the root level (LOG_LEVEL) lets through
+        # Batch records in memory and write them out 256 at a time (or as soon
+        # as a WARNING or worse arrives, so problems are on disk right away)
+        memory_handler = BatchedMemoryHandler(capacity=256, flushLevel=logging.WARNING, target=file_handler)
+        
+        log_queue = queue.Queue(-1)
+        _queue_listener = QueueListener(log_queue, memory_handler, respect_handler_level=True)
+        _queue_listener.start()
+        logger.addHandler(QueueHandler(log_queue))
         
-        # Log startup marker
-        logger.debug("=" * 60)
-        logger.debug(f"Whisper Dictation starting (bundled={is_bundled})")
-        logger.debug(f"Log file: {LOG_FILE}")
-        logger.debug("=" * 60)
+        # Log startup marker (as a single record)
+        logger.info(
+            "\n" + "=" * 60 +
+            f"\nWhisper Dictation starting (bundled={is_bundled})"
+            f"\nLog file: {LOG_FILE}\n" +
+            "=" * 60
+        )
     except Exception as e:
-        logger.warning(f"Could not set up file logging: {e}")
+        logger.warning("Could not set up file logging: %s", e)
     
     return logger
\ No newline at end of file
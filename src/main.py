@@ -2,37 +2,44 @@
 import os
 import sys
 import time
-import tempfile
+import logging
 import threading
 import subprocess
-import pyaudio
-import wave
-import numpy as np
 import rumps
-from pynput import keyboard
-from pynput.keyboard import Key, Controller
-import faster_whisper
 import signal
-import AppKit
-import AVFoundation
-from Quartz import (
-    CGEventMaskBit, kCGEventKeyDown, kCGEventKeyUp, kCGEventFlagsChanged,
-    CGEventGetIntegerValueField, kCGKeyboardEventKeycode,
-    kCGEventFlagMaskShift, CGEventGetFlags
-)
-from ApplicationServices import AXIsProcessTrusted
 from recording_indicator import RecordingIndicator
-from logger_config import setup_logging, get_log_file_path
+from logger_config import setup_logging, get_log_file_path, flush_logs, shutdown_logging
+
+# py2app sets sys.frozen when running as a bundled app; this can't change at runtime
+IS_BUNDLED = getattr(sys, 'frozen', False)
+
+logger = setup_logging(IS_BUNDLED)
 
-logger = setup_logging()
+# ============================================================================
+# LAZY IMPORTS
+# ============================================================================
+# faster_whisper (ctranslate2), pyaudio (PortAudio), pynput and the PyObjC
+# frameworks are imported where they are first used, so the menu bar icon
+# appears without paying their import cost. Set WHISPER_EAGER=1 to import
+# everything at startup (useful when debugging ImportErrors in a build).
+WHISPER_EAGER = os.getenv("WHISPER_EAGER", "false").lower() in ("1", "true")
+
+if WHISPER_EAGER:
+    import faster_whisper
+    import pyaudio
+    import numpy
+    import pynput.keyboard
+    import AppKit
+    import AVFoundation
+    import ApplicationServices
+    import Quartz
 
 # ============================================================================
 # APP BUNDLE DETECTION
 # ============================================================================
 def is_bundled_app():
     """Check if we're running as a bundled .app or from CLI."""
-    # py2app sets sys.frozen when running as a bundled app
-    return getattr(sys, 'frozen', False)
+    return IS_BUNDLED
 
 def send_notification(title, subtitle, message, sound=False):
     """Send a notification, but only if running as a bundled app.
@@ -40,65 +47,96 @@ def send_notification(title, subtitle, message, sound=False):
     rumps.notification() requires an Info.plist with CFBundleIdentifier,
     which only exists in bundled apps. Skip notifications when running from CLI.
     """
-    if is_bundled_app():
+    if IS_BUNDLED:
         try:
             rumps.notification(title=title, subtitle=subtitle, message=message, sound=sound)
         except Exception as e:
-            logger.debug(f"Could not send notification: {e}")
+            logger.debug("Could not send notification: %s", e)
     else:
         # Log the notification content instead when running from CLI
-        logger.info(f"[Notification] {title}: {subtitle} - {message}")
+        logger.info("[Notification] %s: %s - %s", title, subtitle, message)
 
 # ============================================================================
 # PERMISSION CHECKING
 # ============================================================================
+# AVAuthorizationStatus values
+_MIC_STATUS = {
+    0: 'not_determined',
+    1: 'restricted',
+    2: 'denied',
+    3: 'authorized'
+}
+
 def check_microphone_permission():
     """Check if microphone permission is granted.
     
     Returns:
         str: 'authorized', 'denied', 'not_determined', or 'restricted'
     """
+    import AVFoundation
     status = AVFoundation.AVCaptureDevice.authorizationStatusForMediaType_(
         AVFoundation.AVMediaTypeAudio
     )
-    status_map = {
-        0: 'not_determined',
-        1: 'restricted',
-        2: 'denied',
-        3: 'authorized'
-    }
-    return status_map.get(status, 'unknown')
-
-def check_accessibility_permission():
+    return _MIC_STATUS.get(status, 'unknown')
+
+# Cached AXIsProcessTrusted() result as [trusted, monotonic time of check]
+_AX_TRUSTED = [False, float('-inf')]
+_AX_TRUSTED_TTL = 2.0  # seconds
+
+def check_accessibility_permission(refresh=False):
     """Check if accessibility permission is granted.
     
+    The result is cached for a couple of seconds so frequent callers don't
+    cross the Objective-C bridge every time.
+    
+    Args:
+        refresh: Ignore the cached result and ask the system again.
+    
     Returns:
         bool: True if accessibility is enabled, False otherwise
     """
-    return AXIsProcessTrusted()
+    now = time.monotonic()
+    if refresh or now - _AX_TRUSTED[1] > _AX_TRUSTED_TTL:
+        from ApplicationServices import AXIsProcessTrusted
+        _AX_TRUSTED[0] = bool(AXIsProcessTrusted())
+        _AX_TRUSTED[1] = now
+    return _AX_TRUSTED[0]
+
+def invalidate_accessibility_cache():
+    """Force the next check_accessibility_permission() call to re-query."""
+    _AX_TRUSTED[1] = float('-inf')
 
 def request_microphone_permission():
     """Request microphone permission (triggers system prompt on first call)."""
+    import AVFoundation
     # This will trigger the permission prompt if not determined
     AVFoundation.AVCaptureDevice.requestAccessForMediaType_completionHandler_(
         AVFoundation.AVMediaTypeAudio,
-        lambda granted: logger.info(f"Microphone permission granted: {granted}")
+        lambda granted: logger.info("Microphone permission granted: %s", granted)
     )
 
+# Privacy pane URLs, resolved into NSURL objects the first time each is opened
+_PRIVACY_PANE_URLS = {
+    'accessibility': "x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility",
+    'microphone': "x-apple.systempreferences:com.apple.preference.security?Privacy_Microphone",
+}
+_privacy_pane_nsurls = {}
+
+def _open_privacy_pane(pane):
+    """Open System Settings to the given privacy pane ('accessibility' or 'microphone')."""
+    import AppKit
+    url = _privacy_pane_nsurls.get(pane)
+    if url is None:
+        url = _privacy_pane_nsurls[pane] = AppKit.NSURL.URLWithString_(_PRIVACY_PANE_URLS[pane])
+    AppKit.NSWorkspace.sharedWorkspace().openURL_(url)
+
 def open_accessibility_settings():
     """Open System Settings to the Accessibility privacy pane."""
-    # macOS Ventura+ uses different URL scheme
-    url = AppKit.NSURL.URLWithString_(
-        "x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility"
-    )
-    AppKit.NSWorkspace.sharedWorkspace().openURL_(url)
+    _open_privacy_pane('accessibility')
 
 def open_microphone_settings():
     """Open System Settings to the Microphone privacy pane."""
-    url = AppKit.NSURL.URLWithString_(
-        "x-apple.systempreferences:com.apple.preference.security?Privacy_Microphone"
-    )
-    AppKit.NSWorkspace.sharedWorkspace().openURL_(url)
+    _open_privacy_pane('microphone')
 
 # ============================================================================
 # MODEL CACHE CONFIGURATION
@@ -114,6 +152,46 @@ def get_model_cache_dir():
 
 MODEL_CACHE_DIR = get_model_cache_dir()
 
+def is_model_cached(model_name):
+    """Check whether the model is already downloaded (no network access).
+    
+    Resolves the model's snapshot directory in the Hugging Face cache layout
+    under MODEL_CACHE_DIR and checks for its weights file, rather than
+    listing directory contents.
+    """
+    if os.path.isdir(model_name):  # WHISPER_MODEL may be a local model path
+        return os.path.isfile(os.path.join(model_name, "model.bin"))
+
+    import faster_whisper
+    try:
+        path = faster_whisper.download_model(model_name, cache_dir=MODEL_CACHE_DIR, local_files_only=True)
+    except Exception:
+        return False
+    return os.path.isfile(os.path.join(path, "model.bin"))
+
+def find_converted_model(model_name):
+    """Find a model pre-converted to int8 CTranslate2 format, if there is one.
+    
+    Such a model is stored on disk already quantized, so it loads without
+    converting float16 weights at every launch and never touches the network.
+    A copy bundled inside the .app is preferred over one in MODEL_CACHE_DIR.
+    See "Pre-converting the Model" in the README for how to create one.
+    
+    Returns:
+        str: Path to the converted model directory, or None
+    """
+    dir_name = model_name.replace("/", "_") + "-int8"
+    search_dirs = [MODEL_CACHE_DIR]
+    if IS_BUNDLED and os.environ.get("RESOURCEPATH"):
+        # py2app sets RESOURCEPATH to the bundle's Contents/Resources
+        search_dirs.insert(0, os.path.join(os.environ["RESOURCEPATH"], "models"))
+
+    for search_dir in search_dirs:
+        path = os.path.join(search_dir, dir_name)
+        if os.path.isfile(os.path.join(path, "model.bin")):
+            return path
+    return None
+
 # ============================================================================
 # PERFORMANCE CONFIGURATION
 # ============================================================================
@@ -125,42 +203,203 @@ MODEL_CACHE_DIR = get_model_cache_dir()
 #   - "large-v3"  : Slowest, best quality
 WHISPER_MODEL = os.getenv("WHISPER_MODEL", "small.en")
 
-# Compute type for inference (int8 is faster on CPU with minimal quality loss)
-# Options: "default", "int8", "int8_float16", "float16", "float32"
+# Compute type for inference (int8 is faster on CPU with minimal quality loss:
+# int8 weights cut memory bandwidth and use CTranslate2's int8 GEMM kernels)
+# Options: "default", "int8", "int8_float32", "int8_float16", "float16", "float32"
+# If int8 misbehaves on a given Mac, "int8_float32" keeps int8 weights but
+# computes activations in float32.
 WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
 
+# CPU threads for inference. 0 = auto: the number of performance cores, so
+# work isn't spread onto Apple Silicon efficiency cores (see
+# get_performance_core_count)
+WHISPER_CPU_THREADS = int(os.getenv("WHISPER_CPU_THREADS", "0"))
+
+# Fall back to a pynput keyboard listener if the NSEvent monitor can't be
+# registered. Off by default: it adds a second keyboard tap and thread, and
+# needs the same Accessibility permission whose absence usually caused the
+# failure in the first place.
+WHISPER_ENABLE_PYNPUT_FALLBACK = os.getenv("WHISPER_ENABLE_PYNPUT_FALLBACK", "false").lower() == "true"
+
 # Beam size: 1 = greedy (fastest), 5 = beam search (more accurate)
+# Decoder cost grows linearly with beam size, while for short dictated phrases
+# greedy decoding is rarely less accurate. Decoding always runs at a fixed
+# temperature of 0, so there is no sampling and no temperature fallback retry.
 WHISPER_BEAM_SIZE = int(os.getenv("WHISPER_BEAM_SIZE", "1"))
 
-# VAD (Voice Activity Detection) - skips silence for faster processing
-WHISPER_VAD_FILTER = os.getenv("WHISPER_VAD_FILTER", "true").lower() == "true"
+# Push-to-talk recordings start and end with silence, and encoder/decoder cost
+# scales with audio length. Leading/trailing silence is trimmed with a cheap
+# energy check; Whisper's VAD (Voice Activity Detection) is only used when
+# that trim leaves less than MIN_TRIMMED_SECONDS of audio, or can't tell
+# speech from noise (see trim_silence).
+MIN_TRIMMED_SECONDS = 0.5
+# A trim that keeps more than this fraction of the recording is treated as
+# not having found the speech (e.g. loud, uneven background noise)
+MAX_TRIMMED_FRACTION = 0.9
+WHISPER_VAD_PARAMETERS = dict(
+    threshold=0.45,               # Speech probability threshold
+    min_silence_duration_ms=250,  # Shorter silence threshold
+    speech_pad_ms=150,            # Padding around speech
+)
+
+# Recordings whose loudest 10 ms frames average an RMS below this (about
+# -46 dBFS) are treated as silence and never reach the model
+SILENCE_RMS_THRESHOLD = 0.005
+
+# Silence trimming never requires frames louder than this (about -40 dBFS)
+# to count as speech, however noisy the recording
+TRIM_RMS_CEILING = 2 * SILENCE_RMS_THRESHOLD
+
+# Recordings shorter than this (an accidental key tap) never reach the model
+MIN_RECORDING_SECONDS = 0.25
+
+# How long a finished recording waits for the model to finish loading before
+# it is discarded (seconds)
+MODEL_WAIT_TIMEOUT = 30
 # ============================================================================
 
+def get_performance_core_count():
+    """Return the number of performance cores to use for inference.
+    
+    On Apple Silicon this is the P-core count (hw.perflevel0.physicalcpu);
+    elsewhere the physical core count, then os.cpu_count() as a last resort.
+    """
+    for name in ("hw.perflevel0.physicalcpu", "hw.physicalcpu"):
+        try:
+            result = subprocess.run(["sysctl", "-n", name], capture_output=True, text=True, check=True)
+            return int(result.stdout.strip())
+        except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+            continue
+    return os.cpu_count() or 0
+
+# qos_class_t value from <sys/qos.h>
+QOS_CLASS_USER_INITIATED = 0x19
+
+def set_thread_qos_user_initiated():
+    """Mark the calling thread as user-initiated work on macOS.
+    
+    The scheduler keeps user-initiated threads (and threads they create) on
+    performance cores instead of treating a bursty workload as background
+    work for the efficiency cores. No-op where the call isn't available.
+    """
+    import ctypes
+    try:
+        libpthread = ctypes.CDLL("/usr/lib/system/libsystem_pthread.dylib")
+        result = libpthread.pthread_set_qos_class_self_np(QOS_CLASS_USER_INITIATED, 0)
+    except (OSError, AttributeError) as e:
+        logger.debug("Thread QoS not set: %s", e)
+        return
+    if result != 0:
+        logger.debug("pthread_set_qos_class_self_np failed: %s", result)
+
 # Print loaded configuration
 logger.info("=" * 50)
 logger.info("WHISPER DICTATION - Configuration")
 logger.info("=" * 50)
-logger.info(f"  WHISPER_MODEL        = {WHISPER_MODEL}")
-logger.info(f"  WHISPER_COMPUTE_TYPE = {WHISPER_COMPUTE_TYPE}")
-logger.info(f"  WHISPER_BEAM_SIZE    = {WHISPER_BEAM_SIZE}")
-logger.info(f"  WHISPER_VAD_FILTER   = {WHISPER_VAD_FILTER}")
+logger.info("  WHISPER_MODEL        = %s", WHISPER_MODEL)
+logger.info("  WHISPER_COMPUTE_TYPE = %s", WHISPER_COMPUTE_TYPE)
+logger.info("  WHISPER_BEAM_SIZE    = %s", WHISPER_BEAM_SIZE)
+logger.info("  WHISPER_CPU_THREADS  = %s", WHISPER_CPU_THREADS or "auto")
 logger.info("=" * 50)
 
-# Set up a global flag for handling SIGINT
-exit_flag = False
+# Python signal handlers only run when the main thread executes bytecode,
+# which can be delayed indefinitely while it sits in the Cocoa run loop.
+# With a wakeup fd the C-level handler writes the signal number to this pipe
+# immediately, and the watchdog thread blocks reading the other end.
+_wakeup_r, _wakeup_w = os.pipe()
+os.set_blocking(_wakeup_w, False)
+signal.set_wakeup_fd(_wakeup_w)
 
 def signal_handler(sig, frame):
-    """Global signal handler for graceful shutdown"""
-    global exit_flag
-    logger.info("Shutdown signal received, exiting gracefully...")
-    exit_flag = True
-    # Try to force exit if the app doesn't respond quickly
-    threading.Timer(2.0, lambda: os._exit(0)).start()
+    """No-op: a Python handler must be installed for the wakeup fd to be
+    written; the watchdog thread does the actual shutdown"""
 
 # Set up graceful shutdown handling for interrupt and termination signals
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
+# Quitting from the menu terminates NSApp without running atexit handlers
+rumps.events.before_quit.register(shutdown_logging)
+
+# ============================================================================
+# AUDIO CONVERSION
+# ============================================================================
+def pcm_to_float32(samples):
+    """Convert int16 PCM samples to float32 in [-1, 1) for Whisper.
+    
+    A single ufunc pass that writes float32 directly, rather than astype()
+    followed by a division (two passes and a temporary array).
+    """
+    import numpy as np
+    return np.multiply(samples, 1.0 / 32768.0, dtype=np.float32)
+
+def frame_rms(audio, rate):
+    """Return the RMS of each 10 ms frame of float32 audio (a trailing partial frame is dropped)."""
+    import numpy as np
+    frame = rate // 100
+    n_frames = len(audio) // frame
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    return np.sqrt(np.mean(np.square(frames), axis=1))
+
+def trim_silence(audio, rate, pad_ms=200):
+    """Trim leading and trailing silence from float32 audio.
+    
+    Keeps everything between the first and last 10 ms frame louder than the
+    noise floor, plus pad_ms on each side. The floor is estimated from the
+    quietest frames of the whole recording and the threshold is capped at
+    TRIM_RMS_CEILING, so a hotkey click or speech at the very start can't push
+    it above quiet speech. Returns an empty slice when no frame is above it.
+    
+    Returns None when energy can't separate speech from background: the
+    noise floor alone exceeds the cap, or the speech span covers more than
+    MAX_TRIMMED_FRACTION of the recording. Use VAD instead in that case.
+    """
+    import numpy as np
+    frame = rate // 100
+    rms = frame_rms(audio, rate)
+    if not len(rms):
+        return audio
+
+    noise_floor = float(np.percentile(rms, 10))
+    if 2 * noise_floor > TRIM_RMS_CEILING:
+        return None
+    threshold = max(2 * noise_floor, SILENCE_RMS_THRESHOLD)
+    voiced = np.flatnonzero(rms > threshold)
+    if not len(voiced):
+        return audio[:0]
+
+    pad = pad_ms // 10
+    start = max(voiced[0] - pad, 0) * frame
+    end = min(voiced[-1] + 1 + pad, len(rms)) * frame
+    if end - start > MAX_TRIMMED_FRACTION * len(audio):
+        return None
+    return audio[start:end]
+
+# ============================================================================
+# TEXT INSERTION
+# ============================================================================
+# Many apps only read the first 20 UTF-16 code units of a synthetic key
+# event's unicode string, so longer text is posted in chunks of this size
+UNICODE_EVENT_MAX_LENGTH = 20
+
+def utf16_chunks(text, max_units):
+    """Split text into chunks of at most max_units UTF-16 code units.
+    
+    Characters outside the BMP take two code units and are never split.
+    """
+    chunk = []
+    units = 0
+    for char in text:
+        char_units = 2 if ord(char) > 0xFFFF else 1
+        if units + char_units > max_units:
+            yield ''.join(chunk)
+            chunk = []
+            units = 0
+        chunk.append(char)
+        units += char_units
+    if chunk:
+        yield ''.join(chunk)
+
 class WhisperDictationApp(rumps.App):
     def __init__(self):
         super(WhisperDictationApp, self).__init__("🎙️", quit_button=rumps.MenuItem("Quit"))
@@ -173,16 +412,13 @@ class WhisperDictationApp(rumps.App):
 
         # Recording state
         self.recording = False
-        self.audio = pyaudio.PyAudio()
-        self.frames = []
-        self.keyboard_controller = Controller()
+        self._audio = None  # PyAudio instance, created on first use (see audio)
 
-        # Microphone selection (None = use default)
-        self.selected_input_device = None
+        # Microphone selection by device name (None = use default)
+        self.selected_input_name = None
 
         # Create microphone selection submenu
         self.mic_menu = {}
-        self.mic_menu_mapping = {}  # Maps menu title to device index
         self.setup_microphone_menu()
 
         # Permissions menu item
@@ -197,16 +433,34 @@ class WhisperDictationApp(rumps.App):
         self.indicator = RecordingIndicator()
         self.indicator.set_app_reference(self)
 
-        # Initialize Whisper model
-        self.model = None
-        self.load_model_thread = threading.Thread(target=self.load_model)
-        self.load_model_thread.start()
-
-        # Audio recording parameters
-        self.format = pyaudio.paInt16
+        # Audio recording parameters (format and _pa_continue are pyaudio
+        # constants, filled in when PyAudio is loaded; see audio)
+        self.format = None
         self.channels = 1
         self.rate = 16000
-        self.chunk = 1024
+        self.chunk = 2048  # Frames per callback (~128 ms)
+        self._pa_continue = None
+
+        # Recorded samples go into a preallocated int16 buffer (allocated on
+        # first recording, reused afterwards); _audio_pos is the write cursor
+        self.buffer_seconds = 60
+        self._audio_buf = None
+        self._audio_pos = 0
+
+        # Input stream, kept open between recordings (see get_stream)
+        self._stream = None
+        self._stream_device = None
+
+        # Prewarm the Whisper model in the background while the user reads the
+        # menu. model_ready is set once loading finishes (successfully or not)
+        # so recording can start right away and transcription waits on it.
+        # A first-launch download can take minutes, so recording is refused
+        # while model_downloading is set.
+        self.model = None
+        self.model_ready = threading.Event()
+        self.model_downloading = False
+        self.load_model_thread = threading.Thread(target=self.load_model, daemon=True)
+        self.load_model_thread.start()
 
         # Hotkey configuration - we'll listen for globe/fn key (vk=63)
         self.trigger_key = 63  # Key code for globe/fn key
@@ -221,6 +475,7 @@ class WhisperDictationApp(rumps.App):
         self.is_recording_with_key63 = False
 
         self.setup_global_monitor()
+        self.setup_activation_observer()
 
         # Show initial message
         logger.info("Started WhisperDictation app. Look for 🎙️ in your menu bar.")
@@ -231,7 +486,7 @@ class WhisperDictationApp(rumps.App):
         logger.info("Go to System Preferences → Security & Privacy → Privacy → Accessibility")
         logger.info("and add your terminal or the built app to the list.")
 
-        # Start a watchdog thread to check for exit flag
+        # Start a watchdog thread that waits for a shutdown signal
         self.watchdog = threading.Thread(target=self.check_exit_flag, daemon=True)
         self.watchdog.start()
         
@@ -239,15 +494,16 @@ class WhisperDictationApp(rumps.App):
         threading.Timer(1.0, self.check_permissions_on_launch).start()
 
     def check_exit_flag(self):
-        """Monitor the exit flag and terminate the app when set"""
-        while True:
-            if exit_flag:
-                logger.info("Watchdog detected exit flag, shutting down...")
-                self.cleanup()
-                rumps.quit_application()
-                os._exit(0)
-                break
-            time.sleep(0.5)
+        """Wait for a shutdown signal and terminate the app"""
+        signum = os.read(_wakeup_r, 1)[0]
+        logger.info("Shutdown signal %s received, exiting gracefully...", signum)
+        # Get buffered log records on disk in case the forced exit below wins
+        flush_logs()
+        # Force exit if cleanup doesn't finish quickly
+        threading.Timer(2.0, lambda: os._exit(0)).start()
+        self.cleanup()
+        rumps.quit_application()
+        os._exit(0)
 
     def cleanup(self):
         """Clean up resources before exiting"""
@@ -255,35 +511,59 @@ class WhisperDictationApp(rumps.App):
         # Stop recording if in progress
         if self.recording:
             self.recording = False
-            if hasattr(self, 'recording_thread') and self.recording_thread.is_alive():
-                self.recording_thread.join(timeout=1.0)
+            self.stop_stream()
 
         # Remove NSEvent monitor
         if hasattr(self, 'event_monitor') and self.event_monitor:
+            import AppKit
             AppKit.NSEvent.removeMonitor_(self.event_monitor)
             logger.info("NSEvent monitor removed")
 
-        # Close PyAudio
-        if hasattr(self, 'audio'):
+        # Remove app activation observer
+        if getattr(self, 'activation_observer', None):
+            import AppKit
+            AppKit.NSWorkspace.sharedWorkspace().notificationCenter().removeObserver_(self.activation_observer)
+
+        # Close the input stream and PyAudio
+        self.close_stream()
+        if getattr(self, '_audio', None) is not None:
             try:
-                self.audio.terminate()
+                self._audio.terminate()
             except:
                 pass
 
+        # Write any buffered log records to disk
+        shutdown_logging()
+
     def load_model(self):
+        # CTranslate2 starts its worker threads while loading, and they
+        # inherit this thread's QoS
+        set_thread_qos_user_initiated()
+
+        # Size the OpenMP pool before CTranslate2 loads its runtime, so it
+        # doesn't start one thread per logical core (unless the user set it)
+        cpu_threads = WHISPER_CPU_THREADS or get_performance_core_count()
+        os.environ.setdefault("OMP_NUM_THREADS", str(cpu_threads))
+
+        import faster_whisper
+
         self.title = "🎙️ (Loading...)"
         
-        # Check if model exists in cache
-        model_path = os.path.join(MODEL_CACHE_DIR, WHISPER_MODEL.replace("/", "_"))
-        model_exists = os.path.exists(model_path) and os.listdir(model_path) if os.path.isdir(model_path) else False
+        # Prefer a pre-converted int8 model, then the download cache
+        converted_model = find_converted_model(WHISPER_MODEL)
+        model_exists = converted_model is not None or is_model_cached(WHISPER_MODEL)
         
-        if model_exists:
+        if converted_model:
             self.status_item.title = f"Status: Loading {WHISPER_MODEL}..."
-            logger.info(f"Loading cached Whisper model: {WHISPER_MODEL}")
+            logger.info("Loading pre-converted int8 Whisper model: %s", converted_model)
+        elif model_exists:
+            self.status_item.title = f"Status: Loading {WHISPER_MODEL}..."
+            logger.info("Loading cached Whisper model: %s", WHISPER_MODEL)
         else:
+            self.model_downloading = True
             self.status_item.title = f"Status: Downloading {WHISPER_MODEL}... (first launch)"
-            logger.info(f"Downloading Whisper model: {WHISPER_MODEL} (this may take a few minutes)")
-            logger.info(f"Model will be cached at: {MODEL_CACHE_DIR}")
+            logger.info("Downloading Whisper model: %s (this may take a few minutes)", WHISPER_MODEL)
+            logger.info("Model will be cached at: %s", MODEL_CACHE_DIR)
             # Show a notification for first-time download
             send_notification(
                 title="Whisper Dictation",
@@ -293,16 +573,21 @@ class WhisperDictationApp(rumps.App):
             )
         
         try:
-            logger.info(f"Loading Whisper model: {WHISPER_MODEL} (compute_type={WHISPER_COMPUTE_TYPE})")
+            logger.info("Loading Whisper model: %s (compute_type=%s, cpu_threads=%s)", WHISPER_MODEL, WHISPER_COMPUTE_TYPE, cpu_threads)
             self.model = faster_whisper.WhisperModel(
-                WHISPER_MODEL,
+                converted_model or WHISPER_MODEL,
                 device="cpu",  # Use CPU on macOS (MPS not yet supported by CTranslate2)
                 compute_type=WHISPER_COMPUTE_TYPE,
+                cpu_threads=cpu_threads,
+                num_workers=1,  # One transcription at a time
                 download_root=MODEL_CACHE_DIR,  # Use our cache directory
+                local_files_only=converted_model is not None,
             )
-            self.title = "🎙️"
-            self.status_item.title = "Status: Ready"
-            logger.info(f"Whisper model '{WHISPER_MODEL}' loaded successfully!")
+            self.warm_up_model()
+            if not self.recording:
+                self.title = "🎙️"
+                self.status_item.title = "Status: Ready"
+            logger.info("Whisper model '%s' loaded successfully!", WHISPER_MODEL)
             
             if not model_exists:
                 # Notify user that download is complete
@@ -315,21 +600,44 @@ class WhisperDictationApp(rumps.App):
         except Exception as e:
             self.title = "🎙️ (Error)"
             self.status_item.title = "Status: Error loading model"
-            logger.error(f"Error loading model: {e}")
+            logger.error("Error loading model: %s", e)
             send_notification(
                 title="Whisper Dictation",
                 subtitle="Error",
                 message=f"Failed to load model: {str(e)[:100]}",
                 sound=True
             )
+        finally:
+            self.model_downloading = False
+            self.model_ready.set()
+
+    def warm_up_model(self):
+        """Run one second of silence through the model.
+        
+        The first transcribe() call pays for CTranslate2 kernel selection and
+        buffer allocation; doing it here keeps that off the first dictation.
+        """
+        import numpy as np
+
+        try:
+            warmup_start = time.time()
+            segments, _ = self.model.transcribe(
+                np.zeros(self.rate, dtype=np.float32),
+                beam_size=1,
+                vad_filter=False,
+            )
+            list(segments)  # transcribe() is lazy; consume to actually decode
+            logger.info("Model warmed up in %.2fs", time.time() - warmup_start)
+        except Exception as e:
+            logger.warning("Model warm-up failed: %s", e)
 
     def check_permissions_on_launch(self):
         """Check permissions when app launches and show prompt if needed."""
         mic_status = check_microphone_permission()
         mic_ok = mic_status == 'authorized'
-        acc_ok = check_accessibility_permission()
+        acc_ok = check_accessibility_permission(refresh=True)
         
-        logger.info(f"Launch permission check - Microphone: {mic_status}, Accessibility: {acc_ok}")
+        logger.info("Launch permission check - Microphone: %s, Accessibility: %s", mic_status, acc_ok)
         
         # Request microphone permission if not determined yet
         if mic_status == 'not_determined':
@@ -384,9 +692,9 @@ class WhisperDictationApp(rumps.App):
     def check_permissions_clicked(self, _):
         """Handle click on 'Check Permissions' menu item."""
         mic_ok = check_microphone_permission() == 'authorized'
-        acc_ok = check_accessibility_permission()
+        acc_ok = check_accessibility_permission(refresh=True)
         
-        logger.info(f"Permission check - Microphone: {mic_ok}, Accessibility: {acc_ok}")
+        logger.info("Permission check - Microphone: %s, Accessibility: %s", mic_ok, acc_ok)
         
         if mic_ok and acc_ok:
             self.status_item.title = "Status: Ready"
@@ -433,7 +741,8 @@ class WhisperDictationApp(rumps.App):
     def view_logs_clicked(self, _):
         """Open the log file in Console.app or Finder."""
         log_path = get_log_file_path()
-        logger.info(f"Opening log file: {log_path}")
+        logger.info("Opening log file: %s", log_path)
+        flush_logs()
         
         if os.path.exists(log_path):
             # Open with Console.app for better log viewing
@@ -448,24 +757,76 @@ class WhisperDictationApp(rumps.App):
     def setup_microphone_menu(self):
         """Setup the microphone selection submenu"""
         self.mic_submenu = rumps.MenuItem("Microphone")
+        self.populate_microphone_menu()
+
+    def populate_microphone_menu(self):
+        """(Re)build the microphone submenu items from the input device list"""
+        # A fresh MenuItem has no NSMenu yet, and rumps' clear() doesn't check
+        if len(self.mic_submenu):
+            self.mic_submenu.clear()
+        self.mic_menu = {}
         devices = self.get_input_devices()
 
+        # Drop a selection whose device is gone (falls back to the default)
+        if self.selected_input_name not in [device['name'] for device in devices]:
+            self.selected_input_name = None
+
         for device in devices:
             title = device['name']
             if device['is_default']:
                 title += " (Default)"
 
             menu_item = rumps.MenuItem(title, callback=self.select_microphone)
-            # Mark the default device as selected initially
-            if device['is_default']:
-                menu_item.state = True
+            menu_item.device_name = device['name']
+            # Mark the selected device, or the default if none was picked
+            if self.selected_input_name is None:
+                menu_item.state = device['is_default']
+            else:
+                menu_item.state = device['name'] == self.selected_input_name
 
             self.mic_menu[title] = menu_item
-            self.mic_menu_mapping[title] = device['index']
             self.mic_submenu.add(menu_item)
 
+        self.mic_submenu.add(None)
+        self.mic_submenu.add(rumps.MenuItem("Refresh Devices", callback=self.refresh_devices_clicked))
+
+    def refresh_devices_clicked(self, _):
+        """Re-scan audio input devices and rebuild the Microphone menu."""
+        if self.recording:
+            logger.info("Not refreshing devices while recording")
+            return
+
+        # PortAudio only enumerates devices when it is initialized, so drop
+        # the instance; the next recording starts a fresh one that sees newly
+        # connected microphones
+        self.close_stream()
+        if self._audio is not None:
+            self._audio.terminate()
+            self._audio = None
+
+        self.populate_microphone_menu()
+        logger.info("Audio input devices refreshed")
+
+    def setup_activation_observer(self):
+        """Re-check accessibility whenever the user switches apps.
+        
+        Permission is usually granted in System Settings, so switching back
+        from it is the moment the cached result goes stale.
+        """
+        import AppKit
+        
+        center = AppKit.NSWorkspace.sharedWorkspace().notificationCenter()
+        self.activation_observer = center.addObserverForName_object_queue_usingBlock_(
+            AppKit.NSWorkspaceDidActivateApplicationNotification,
+            None,
+            None,
+            lambda notification: invalidate_accessibility_cache()
+        )
+
     def setup_global_monitor(self):
         """Set up keyboard monitoring using native macOS NSEvent."""
+        import AppKit
+
         logger.info("Setting up global keyboard monitor using NSEvent...")
         
         # Key codes
@@ -488,7 +849,8 @@ class WhisperDictationApp(rumps.App):
                 event_type = event.type()
                 keycode = event.keyCode()
                 
-                logger.debug(f"NSEvent: type={event_type}, keyCode={keycode}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("NSEvent: type=%s, keyCode=%s", event_type, keycode)
                 
                 # Handle modifier key changes (for Right Shift)
                 if event_type == AppKit.NSEventTypeFlagsChanged:
@@ -514,16 +876,16 @@ class WhisperDictationApp(rumps.App):
                                 self.shift_held = False
                                 
                                 if hold_duration < self.shift_threshold:
-                                    logger.info(f"Held for {hold_duration:.2f}s - discarding (< {self.shift_threshold}s)")
+                                    logger.info("Held for %.2fs - discarding (< %ss)", hold_duration, self.shift_threshold)
                                     self.discard_recording()
                                 else:
-                                    logger.info(f"Held for {hold_duration:.2f}s - processing")
+                                    logger.info("Held for %.2fs - processing", hold_duration)
                                     self.stop_recording()
                 
                 # Handle Globe/Fn key (regular key down/up)
                 elif event_type == AppKit.NSEventTypeKeyDown:
                     if keycode == self.GLOBE_FN_KEYCODE:
-                        logger.info(f"Globe/Fn key DOWN (keycode={keycode})")
+                        logger.info("Globe/Fn key DOWN (keycode=%s)", keycode)
                         # Toggle recording on key down for Globe/Fn
                         if not self.recording and not self.is_recording_with_key63:
                             self.is_recording_with_key63 = True
@@ -531,13 +893,13 @@ class WhisperDictationApp(rumps.App):
                             
                 elif event_type == AppKit.NSEventTypeKeyUp:
                     if keycode == self.GLOBE_FN_KEYCODE:
-                        logger.info(f"Globe/Fn key UP (keycode={keycode})")
+                        logger.info("Globe/Fn key UP (keycode=%s)", keycode)
                         if self.recording and self.is_recording_with_key63:
                             self.is_recording_with_key63 = False
                             self.stop_recording()
                             
             except Exception as e:
-                logger.error(f"Error in event handler: {e}")
+                logger.error("Error in event handler: %s", e)
                 import traceback
                 logger.error(traceback.format_exc())
         
@@ -549,7 +911,7 @@ class WhisperDictationApp(rumps.App):
         
         if self.event_monitor:
             logger.info("NSEvent global monitor registered successfully")
-        else:
+        elif WHISPER_ENABLE_PYNPUT_FALLBACK:
             logger.error("Failed to register NSEvent global monitor")
             # Fall back to pynput
             logger.info("Falling back to pynput keyboard listener...")
@@ -557,20 +919,58 @@ class WhisperDictationApp(rumps.App):
             self.key_monitor_thread.daemon = True
             self.key_monitor_thread.start()
             logger.info("Keyboard monitor thread started")
+        else:
+            # Hotkeys stay disabled until the permission problem is fixed and
+            # the app restarted; the menu's Start Recording still works
+            logger.error("Failed to register NSEvent global monitor - hotkeys disabled")
+            self.status_item.title = "Status: Hotkeys unavailable (check Accessibility)"
+            send_notification(
+                title="Whisper Dictation",
+                subtitle="Hotkeys unavailable",
+                message="Grant Accessibility permission, then restart the app.",
+                sound=True
+            )
+
+    @property
+    def audio(self):
+        """PyAudio instance, initialized on first use.
+        
+        Initializing PortAudio enumerates every CoreAudio device, so it is
+        deferred until the first recording instead of slowing down launch.
+        """
+        if self._audio is None:
+            import pyaudio
+            self.format = pyaudio.paInt16
+            self._pa_continue = pyaudio.paContinue
+            self._audio = pyaudio.PyAudio()
+        return self._audio
 
     def get_input_devices(self):
-        """Get list of available audio input devices"""
+        """Get list of available audio input devices
+        
+        Lists microphones through AVFoundation, which is much cheaper than
+        initializing PortAudio just to build the menu. Only called when the
+        menu is built (at launch and from Refresh Devices).
+        """
+        import AVFoundation
+        default = AVFoundation.AVCaptureDevice.defaultDeviceWithMediaType_(AVFoundation.AVMediaTypeAudio)
+        default_id = default.uniqueID() if default is not None else None
+
         devices = []
-        default_index = self.audio.get_default_input_device_info()['index']
+        for device in AVFoundation.AVCaptureDevice.devicesWithMediaType_(AVFoundation.AVMediaTypeAudio):
+            devices.append({
+                'name': str(device.localizedName()),
+                'is_default': device.uniqueID() == default_id
+            })
+        return devices
+
+    def find_input_device_index(self, name):
+        """Return the PortAudio index of the input device with this name, or None."""
         for i in range(self.audio.get_device_count()):
             info = self.audio.get_device_info_by_index(i)
-            if info['maxInputChannels'] > 0:
-                devices.append({
-                    'index': info['index'],
-                    'name': info['name'],
-                    'is_default': info['index'] == default_index
-                })
-        return devices
+            if info['maxInputChannels'] > 0 and info['name'] == name:
+                return i
+        return None
 
     def select_microphone(self, sender):
         """Callback when a microphone is selected from the menu"""
@@ -579,103 +979,117 @@ class WhisperDictationApp(rumps.App):
             item.state = False
         # Check the selected item
         sender.state = True
-        # Store the device index (stored in the menu item's title parsing or we use a mapping)
-        device_index = self.mic_menu_mapping.get(sender.title)
-        self.selected_input_device = device_index
-        device_name = sender.title.replace(" (Default)", "")
-        logger.info(f"Microphone changed to: {device_name}")
+        # Store the device name; it's resolved to a PortAudio index when the
+        # stream is opened
+        device_name = sender.device_name
+        self.selected_input_name = device_name
+        logger.info("Microphone changed to: %s", device_name)
 
     def discard_recording(self):
         """Discard current recording without processing (held too short)"""
         self.recording = False
-        if hasattr(self, 'recording_thread') and self.recording_thread.is_alive():
-            self.recording_thread.join(timeout=0.5)
-        self.frames = []
+        self.stop_stream()
+        self._audio_pos = 0
         self.indicator.stop()
         self.title = "🎙️"
         self.status_item.title = "Status: Recording discarded (too short)"
         logger.info("Recording discarded - held for less than threshold")
 
     def monitor_keys(self):
+        from pynput import keyboard
+        from pynput.keyboard import Key
+
         # Track state of key 63 (Globe/Fn key)
         self.is_recording_with_key63 = False
         
         logger.info("monitor_keys() started - initializing keyboard listener")
-        logger.info(f"Accessibility permission check: {check_accessibility_permission()}")
+        logger.info("Accessibility permission check: %s", check_accessibility_permission())
+
+        # Called for every keystroke system-wide: bind the hotkeys to locals
+        # and return early for the common case of an unrelated key
+        trigger_vk = self.trigger_key
+        shift_r = Key.shift_r
 
         def on_press(key):
             # Log ALL key presses for debugging
-            key_info = f"key={key}"
-            if hasattr(key, 'vk'):
-                key_info += f", vk={key.vk}"
-            if hasattr(key, 'char'):
-                key_info += f", char={key.char}"
-            logger.debug(f"KEY PRESS: {key_info}")
-            
-            # If Right Shift is held and another key is pressed, cancel recording (user is typing)
-            if self.shift_held and key != Key.shift_r:
-                logger.info("Other key pressed while Right Shift held - canceling recording")
-                self.shift_held = False
-                self.discard_recording()
-                return
-
-            # Log when target key is pressed
-            if hasattr(key, 'vk') and key.vk == self.trigger_key:
-                logger.info(f"Target key (vk={key.vk}) pressed")
+            if logger.isEnabledFor(logging.DEBUG):
+                key_info = f"key={key}"
+                if hasattr(key, 'vk'):
+                    key_info += f", vk={key.vk}"
+                if hasattr(key, 'char'):
+                    key_info += f", char={key.char}"
+                logger.debug("KEY PRESS: %s", key_info)
 
             # Right Shift handling - start recording immediately (optimistic)
-            if key == Key.shift_r:
-                logger.info(f"Right Shift detected! recording={self.recording}")
+            if key == shift_r:
+                logger.info("Right Shift detected! recording=%s", self.recording)
                 if not self.recording:
                     logger.info("Right Shift pressed - starting recording immediately")
                     self.shift_press_time = time.time()
                     self.shift_held = True
                     self.start_recording()
+                return
+
+            # If Right Shift is held and another key is pressed, cancel recording (user is typing)
+            if self.shift_held:
+                logger.info("Other key pressed while Right Shift held - canceling recording")
+                self.shift_held = False
+                self.discard_recording()
+                return
+
+            # Log when target key is pressed
+            if getattr(key, 'vk', None) == trigger_vk:
+                logger.info("Target key (vk=%s) pressed", trigger_vk)
 
         def on_release(key):
             # Log ALL key releases for debugging
-            key_info = f"key={key}"
-            if hasattr(key, 'vk'):
-                key_info += f", vk={key.vk}"
-            logger.debug(f"KEY RELEASE: {key_info}")
-            
-            if hasattr(key, 'vk'):
-                if key.vk == self.trigger_key:
-                    if not self.recording and not self.is_recording_with_key63:
-                        logger.info(f"Globe/Fn key (vk={key.vk}) released - STARTING recording")
-                        self.is_recording_with_key63 = True
-                        self.start_recording()
-                    elif self.recording and self.is_recording_with_key63:
-                        logger.info(f"Globe/Fn key (vk={key.vk}) released - STOPPING recording")
-                        self.is_recording_with_key63 = False
-                        self.stop_recording()
+            if logger.isEnabledFor(logging.DEBUG):
+                key_info = f"key={key}"
+                if hasattr(key, 'vk'):
+                    key_info += f", vk={key.vk}"
+                logger.debug("KEY RELEASE: %s", key_info)
 
             # Right Shift handling - check duration and discard or process
-            if key == Key.shift_r and self.shift_held:
+            if key == shift_r:
+                if not self.shift_held:
+                    return
                 hold_duration = time.time() - self.shift_press_time
                 self.shift_held = False
 
                 if hold_duration < self.shift_threshold:
-                    logger.info(f"Right Shift released after {hold_duration:.2f}s - discarding (< {self.shift_threshold}s)")
+                    logger.info("Right Shift released after %.2fs - discarding (< %ss)", hold_duration, self.shift_threshold)
                     self.discard_recording()
                 else:
-                    logger.info(f"Right Shift released after {hold_duration:.2f}s - processing")
+                    logger.info("Right Shift released after %.2fs - processing", hold_duration)
                     self.stop_recording()
+                return
+
+            if getattr(key, 'vk', None) != trigger_vk:
+                return
+
+            if not self.recording and not self.is_recording_with_key63:
+                logger.info("Globe/Fn key (vk=%s) released - STARTING recording", trigger_vk)
+                self.is_recording_with_key63 = True
+                self.start_recording()
+            elif self.recording and self.is_recording_with_key63:
+                logger.info("Globe/Fn key (vk=%s) released - STOPPING recording", trigger_vk)
+                self.is_recording_with_key63 = False
+                self.stop_recording()
 
         try:
             logger.info("Creating keyboard.Listener...")
             listener = keyboard.Listener(on_press=on_press, on_release=on_release)
-            logger.info(f"Listener created: {listener}")
+            logger.info("Listener created: %s", listener)
             listener.start()
             logger.info("Keyboard listener STARTED successfully - waiting for key events")
-            logger.info(f"Listening for: Globe/Fn key (vk={self.trigger_key}) and Right Shift")
+            logger.info("Listening for: Globe/Fn key (vk=%s) and Right Shift", self.trigger_key)
             listener.join()
             logger.warning("Keyboard listener exited join() - this shouldn't happen normally")
         except Exception as e:
-            logger.error(f"FAILED to start keyboard listener: {e}")
-            logger.error(f"Exception type: {type(e).__name__}")
+            logger.error("FAILED to start keyboard listener: %s", e)
+            logger.error("Exception type: %s", type(e).__name__)
             import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Traceback: %s", traceback.format_exc())
             logger.error("This usually means Accessibility permissions are not granted")
 
     @rumps.clicked("Start Recording")  # This will be matched by title
@@ -687,31 +1101,68 @@ class WhisperDictationApp(rumps.App):
             self.stop_recording()
             sender.title = "Start Recording"
 
+    def reset_hotkey_state(self):
+        """Forget a hotkey press whose recording was refused.
+        
+        Otherwise the next Globe/Fn press is treated as the stop of a
+        recording that never started.
+        """
+        self.is_recording_with_key63 = False
+        self.shift_held = False
+
     def start_recording(self):
-        if not hasattr(self, 'model') or self.model is None:
-            logger.warning("Model not loaded. Please wait for the model to finish loading.")
-            self.status_item.title = "Status: Waiting for model to load"
+        # Recording may start while the model is still loading; only refuse
+        # once loading has finished without producing a model.
+        if self.model_ready.is_set() and self.model is None:
+            logger.warning("Model failed to load. Cannot record.")
+            self.status_item.title = "Status: Error loading model"
+            self.reset_hotkey_state()
+            return
+        if self.model_downloading:
+            logger.info("Model is still downloading. Not recording.")
+            send_notification(
+                title="Whisper Dictation",
+                subtitle="Still downloading speech model",
+                message="Dictation will be available once the download finishes.",
+                sound=False
+            )
+            self.reset_hotkey_state()
             return
 
-        self.frames = []
+        import numpy as np
+
+        if self._audio_buf is None:
+            self._audio_buf = np.empty(self.rate * self.buffer_seconds, dtype=np.int16)
+        self._audio_pos = 0
         self.recording = True
 
+        # Show recording indicator
+        self.indicator.start()
+
+        # Start capturing; PortAudio delivers buffers to audio_callback
+        try:
+            self.get_stream().start_stream()
+        except Exception as e:
+            logger.error("Could not open microphone: %s", e)
+            self.close_stream()
+            self.recording = False
+            self.indicator.stop()
+            self.title = "🎙️"
+            self.status_item.title = "Status: Could not open microphone"
+            self.reset_hotkey_state()
+            return
+
         # Update UI
         self.title = "🎙️ (Recording)"
         self.status_item.title = "Status: Recording..."
         logger.info("Recording started. Speak now...")
 
-        # Show recording indicator
-        self.indicator.start()
-
-        # Start recording thread
-        self.recording_thread = threading.Thread(target=self.record_audio)
-        self.recording_thread.start()
-
     def stop_recording(self):
+        import numpy as np
+
         self.recording = False
-        if hasattr(self, 'recording_thread'):
-            self.recording_thread.join()
+        # Returns once the last audio callback has finished writing
+        self.stop_stream()
 
         # Hide recording indicator
         self.indicator.stop()
@@ -721,75 +1172,166 @@ class WhisperDictationApp(rumps.App):
         self.status_item.title = "Status: Transcribing..."
         logger.info("Recording stopped. Transcribing...")
 
+        # Convert to float32 here, which also copies the samples out of the
+        # shared buffer before a new recording can overwrite them
+        if self._audio_buf is None:
+            audio = np.empty(0, dtype=np.float32)
+        else:
+            audio = pcm_to_float32(self._audio_buf[:self._audio_pos])
+
         # Process in background
-        transcribe_thread = threading.Thread(target=self.process_recording)
+        transcribe_thread = threading.Thread(target=self.process_recording, args=(audio,))
         transcribe_thread.start()
 
-    def process_recording(self):
+    def process_recording(self, audio):
+        set_thread_qos_user_initiated()
+
         # Transcribe and insert text
         try:
-            self.transcribe_audio()
+            self.transcribe_audio(audio)
         except Exception as e:
-            logger.error(f"Error during transcription: {e}")
+            logger.error("Error during transcription: %s", e)
             self.status_item.title = "Status: Error during transcription"
         finally:
             self.title = "🎙️"  # Reset title
 
-    def record_audio(self):
-        # Build kwargs for audio stream
-        stream_kwargs = {
-            'format': self.format,
-            'channels': self.channels,
-            'rate': self.rate,
-            'input': True,
-            'frames_per_buffer': self.chunk
-        }
-        # Use selected input device if specified
-        if self.selected_input_device is not None:
-            stream_kwargs['input_device_index'] = self.selected_input_device
-
-        stream = self.audio.open(**stream_kwargs)
-
-        while self.recording:
-            data = stream.read(self.chunk)
-            self.frames.append(data)
-
-            # Update indicator with audio level
-            self.indicator.update_audio_level(data)
-
-        stream.stop_stream()
-        stream.close()
-
-    def transcribe_audio(self):
-        if not self.frames:
+    def get_stream(self):
+        """Return the input stream for the selected device, opening it if needed.
+        
+        Opening a CoreAudio input stream is slow, so the stream is kept open
+        (stopped) between recordings and only reopened when the selected
+        microphone changes.
+        """
+        if self._stream is not None and self._stream_device != self.selected_input_name:
+            self.close_stream()
+
+        if self._stream is None:
+            audio = self.audio  # Loads PyAudio (and self.format) on first use
+
+            # Build kwargs for audio stream
+            stream_kwargs = {
+                'format': self.format,
+                'channels': self.channels,
+                'rate': self.rate,
+                'input': True,
+                'frames_per_buffer': self.chunk,
+                'stream_callback': self.audio_callback,
+                'start': False,
+            }
+            # Use selected input device if specified
+            if self.selected_input_name is not None:
+                device_index = self.find_input_device_index(self.selected_input_name)
+                if device_index is None:
+                    logger.warning("Microphone '%s' not found, using default input", self.selected_input_name)
+                else:
+                    stream_kwargs['input_device_index'] = device_index
+
+            self._stream = audio.open(**stream_kwargs)
+            self._stream_device = self.selected_input_name
+        return self._stream
+
+    def stop_stream(self):
+        """Stop the input stream (blocks until the last callback returns)."""
+        if self._stream is not None:
+            try:
+                self._stream.stop_stream()
+            except Exception as e:
+                # e.g. the device was unplugged; reopen on the next recording
+                logger.error("Error stopping audio stream: %s", e)
+                self.close_stream()
+
+    def close_stream(self):
+        """Close the cached input stream, if any."""
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception as e:
+                logger.debug("Error closing audio stream: %s", e)
+            self._stream = None
+
+    def audio_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio stream callback: append a buffer of samples to the recording.
+        
+        Runs on PortAudio's audio thread, so there's no Python recording thread
+        polling stream.read().
+        """
+        import numpy as np
+
+        if not self.recording:
+            return (None, self._pa_continue)
+
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        end = self._audio_pos + len(samples)
+        if end > len(self._audio_buf):
+            # Longer than the buffer: grow it (doubling keeps this rare)
+            self._audio_buf = np.resize(self._audio_buf, max(end, 2 * len(self._audio_buf)))
+        self._audio_buf[self._audio_pos:end] = samples
+        self._audio_pos = end
+
+        # Update indicator with the buffer's RMS level
+        self.indicator.update_audio_level(samples)
+
+        return (None, self._pa_continue)
+
+    def transcribe_audio(self, audio):
+        """Transcribe float32 mono audio at self.rate and type the result."""
+        if not len(audio):
             self.title = "🎙️"
             self.status_item.title = "Status: No audio recorded"
             logger.warning("No audio recorded")
             return
 
-        # Save the recorded audio to a temporary file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_filename = temp_file.name
+        duration = len(audio) / self.rate
+        if duration < MIN_RECORDING_SECONDS:
+            logger.info("Recording too short (%.2fs) - skipping transcription", duration)
+            self.status_item.title = "Status: No speech detected"
+            return
 
-        with wave.open(temp_filename, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(self.audio.get_sample_size(self.format))
-            wf.setframerate(self.rate)
-            wf.writeframes(b''.join(self.frames))
+        import numpy as np
 
-        logger.debug("Audio saved to temporary file. Transcribing...")
+        # Cheap energy gate: skip the whole encoder/decoder pass for a key
+        # held down without speaking. Gate on the loudest 100 ms rather than
+        # the whole recording, so a long hold doesn't dilute short speech.
+        loudest = np.sort(frame_rms(audio, self.rate))[-10:]
+        rms = float(loudest.mean())
+        if rms < SILENCE_RMS_THRESHOLD:
+            logger.info("Recording is silent (peak RMS %.4f) - skipping transcription", rms)
+            self.status_item.title = "Status: No speech detected"
+            return
+
+        if not self.model_ready.is_set():
+            self.status_item.title = "Status: Waiting for model to load..."
+            logger.info("Waiting for Whisper model to finish loading...")
+            # Don't type into whatever window has focus minutes from now
+            if not self.model_ready.wait(MODEL_WAIT_TIMEOUT):
+                logger.warning("Model still loading after %ss - discarding recording", MODEL_WAIT_TIMEOUT)
+                self.status_item.title = "Status: Model still loading, recording discarded"
+                return
+        if self.model is None:
+            self.status_item.title = "Status: Error loading model"
+            logger.error("Cannot transcribe: Whisper model failed to load")
+            return
+
+        # Energy-based trim is nearly free; only fall back to Silero VAD when
+        # it can't find the speech or leaves too little audio to trust
+        trimmed = trim_silence(audio, self.rate)
+        use_vad = trimmed is None or len(trimmed) < MIN_TRIMMED_SECONDS * self.rate
+        if not use_vad:
+            logger.debug("Trimmed silence: %.2fs -> %.2fs", len(audio) / self.rate, len(trimmed) / self.rate)
+            audio = trimmed
 
         # Transcribe with Whisper
         try:
             transcribe_start = time.time()
             segments, info = self.model.transcribe(
-                temp_filename,
+                audio,
                 beam_size=WHISPER_BEAM_SIZE,
-                vad_filter=WHISPER_VAD_FILTER,
-                vad_parameters=dict(
-                    min_silence_duration_ms=300,  # Shorter silence threshold
-                    speech_pad_ms=200,            # Padding around speech
-                ),
+                temperature=0.0,                   # Single pass, no fallback retries
+                vad_filter=use_vad,
+                vad_parameters=WHISPER_VAD_PARAMETERS,
+                condition_on_previous_text=False,  # Each dictation stands alone
+                without_timestamps=True,           # We only need the text
+                word_timestamps=False,
             )
 
             text = ""
@@ -798,27 +1340,39 @@ class WhisperDictationApp(rumps.App):
             text = text.strip()  # Remove leading/trailing whitespace (Whisper adds leading space)
 
             transcribe_time = time.time() - transcribe_start
-            logger.info(f"Transcription took {transcribe_time:.2f}s (audio: {info.duration:.1f}s, ratio: {transcribe_time/info.duration:.2f}x)")
+            logger.info("Transcription took %.2fs (audio: %.1fs, ratio: %.2fx)", transcribe_time, info.duration, transcribe_time/info.duration)
 
             if text:
                 self.insert_text(text)
-                logger.info(f"Transcription: {text}")
+                logger.info("Transcription: %s", text)
                 self.status_item.title = f"Status: Transcribed: {text[:30]}..."
             else:
                 logger.warning("No speech detected")
                 self.status_item.title = "Status: No speech detected"
         except Exception as e:
-            logger.error(f"Transcription error: {e}")
+            logger.error("Transcription error: %s", e)
             self.status_item.title = "Status: Transcription error"
             raise
-        finally:
-            # Clean up the temporary file
-            os.unlink(temp_filename)
 
     def insert_text(self, text):
-        # Type text at cursor position without altering the clipboard
+        """Type text at the cursor position without altering the clipboard.
+        
+        Posts synthetic key events carrying the text as a unicode string, a
+        chunk of characters per event instead of one keystroke per character.
+        """
+        from Quartz import (
+            CGEventCreateKeyboardEvent, CGEventKeyboardSetUnicodeString,
+            CGEventSetFlags, CGEventPost, kCGHIDEventTap
+        )
+
         logger.debug("Typing text at cursor position...")
-        self.keyboard_controller.type(text)
+        for chunk in utf16_chunks(text, UNICODE_EVENT_MAX_LENGTH):
+            length = len(chunk.encode('utf-16-le')) // 2
+            for key_down in (True, False):
+                event = CGEventCreateKeyboardEvent(None, 0, key_down)
+                CGEventSetFlags(event, 0)  # Ignore modifiers still held down
+                CGEventKeyboardSetUnicodeString(event, length, chunk)
+                CGEventPost(kCGHIDEventTap, event)
         logger.debug("Text typed successfully")
 
     def handle_shutdown(self, _signal, _frame):
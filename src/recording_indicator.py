@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
-import numpy as np
-from logger_config import setup_logging
+import logging
 
-logger = setup_logging()
+# Logging is configured once, by main.py
+logger = logging.getLogger(__name__)
 
 
 class RecordingIndicator:
@@ -38,22 +38,38 @@ class RecordingIndicator:
         self.running = False
         logger.info("Recording indicator stopped")
 
-    def update_audio_level(self, audio_data):
-        """Update the audio level based on incoming audio data
+    def update_audio_level(self, pcm_view):
+        """Update the audio level from a chunk of samples
 
         Args:
-            audio_data: Raw audio bytes from pyaudio
+            pcm_view: int16 numpy array of samples (e.g. np.frombuffer over
+                the raw pyaudio bytes, no copy needed)
         """
         if not self.running or not self.app_reference:
             return
 
+        import numpy as np
+
         try:
-            # Convert bytes to numpy array, then to float to avoid integer overflow when squaring
-            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float64)
+            # Square into an int64 accumulator: no float copy of the chunk
+            # and no int16 overflow, then a single sqrt
+            rms = float(np.sqrt(np.mean(np.square(pcm_view, dtype=np.int64))))
+        except Exception as e:
+            logger.debug("Error updating audio level: %s", e)
+            return
+
+        self.update_audio_level_rms(rms)
+
+    def update_audio_level_rms(self, rms):
+        """Update the audio level from a precomputed RMS value
 
-            # Calculate RMS (Root Mean Square) level
-            rms = np.sqrt(np.mean(audio_array**2))
+        Args:
+            rms: RMS of the latest chunk of int16 samples
+        """
+        if not self.running or not self.app_reference:
+            return
 
+        try:
             # Normalize to 0-1 range
             max_rms = 3000
             normalized_level = min(rms / max_rms, 1.0)
@@ -76,4 +92,4 @@ class RecordingIndicator:
             # Animate the icon
             self.app_reference.title = f"{icon} REC"
         except Exception as e:
-            logger.debug(f"Error updating audio level: {e}")
+            logger.debug("Error updating audio level: %s", e)